@@ -1,5 +1,8 @@
 from django.contrib import admin
+from django.db.models import F
+from django.utils import timezone
 from django.utils.html import format_html
+from .list_cache import invalidate_article_lists
 from .models import Article
 
 
@@ -25,7 +28,7 @@ class ArticleAdmin(admin.ModelAdmin):
         'featured', 
         'created_at',
         'published_at',
-        'author'
+        ('author', admin.RelatedOnlyFieldListFilter)
     ]
     
     search_fields = [
@@ -39,6 +42,9 @@ class ArticleAdmin(admin.ModelAdmin):
     
     prepopulated_fields = {'slug': ('title',)}
     
+    # Look authors up through the User admin's search instead of a full <select>
+    autocomplete_fields = ['author']
+    
     readonly_fields = [
         'view_count', 
         'created_at', 
@@ -73,6 +79,28 @@ class ArticleAdmin(admin.ModelAdmin):
     date_hierarchy = 'created_at'
     ordering = ['-created_at']
     
+    # Join the author in the changelist query instead of one lookup per row
+    list_select_related = ('author',)
+    
+    def get_queryset(self, request):
+        """Fetch the author alongside each article."""
+        return super().get_queryset(request).select_related('author')
+    
+    def save_model(self, request, obj, form, change):
+        """Save the article and drop cached list pages."""
+        super().save_model(request, obj, form, change)
+        invalidate_article_lists()
+    
+    def delete_model(self, request, obj):
+        """Delete the article and drop cached list pages."""
+        super().delete_model(request, obj)
+        invalidate_article_lists()
+    
+    def delete_queryset(self, request, queryset):
+        """Delete the selected articles and drop cached list pages."""
+        super().delete_queryset(request, queryset)
+        invalidate_article_lists()
+    
     def featured_badge(self, obj):
         """Display featured status as a badge."""
         if obj.featured:
@@ -90,26 +118,29 @@ class ArticleAdmin(admin.ModelAdmin):
     
     def word_count_display(self, obj):
         """Display word count."""
-        return len(obj.content.split()) if obj.content else 0
+        return obj.word_count
     word_count_display.short_description = 'Word Count'
     
     def mark_as_published(self, request, queryset):
         """Admin action to mark articles as published."""
-        from django.utils import timezone
-        count = queryset.update(status='published', published_at=timezone.now())
+        now = timezone.now()
+        count = queryset.update(status='published', published_at=now, updated_at=now)
+        invalidate_article_lists()
         self.message_user(request, f'{count} article(s) marked as published.')
     mark_as_published.short_description = 'Mark selected articles as published'
     
     def mark_as_draft(self, request, queryset):
         """Admin action to mark articles as draft."""
-        count = queryset.update(status='draft', published_at=None)
+        count = queryset.update(
+            status='draft', published_at=None, updated_at=timezone.now()
+        )
+        invalidate_article_lists()
         self.message_user(request, f'{count} article(s) marked as draft.')
     mark_as_draft.short_description = 'Mark selected articles as draft'
     
     def toggle_featured(self, request, queryset):
         """Admin action to toggle featured status."""
-        for article in queryset:
-            article.featured = not article.featured
-            article.save(update_fields=['featured'])
-        self.message_user(request, f'Featured status toggled for {queryset.count()} article(s).')
+        count = queryset.update(featured=~F('featured'), updated_at=timezone.now())
+        invalidate_article_lists()
+        self.message_user(request, f'Featured status toggled for {count} article(s).')
     toggle_featured.short_description = 'Toggle featured status'
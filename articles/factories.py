@@ -16,14 +16,8 @@ class UserFactory(factory.django.DjangoModelFactory):
     email = factory.LazyAttribute(lambda obj: f"{obj.username}@example.com")
     first_name = factory.Faker('first_name')
     last_name = factory.Faker('last_name')
-    
-    @factory.post_generation
-    def password(self, create, extracted, **kwargs):
-        if not create:
-            return
-        password = extracted or 'defaultpass123'
-        self.set_password(password)
-        self.save()
+    # Hashed before the INSERT (and on build()), so no second save is needed
+    password = factory.django.Password('defaultpass123')
 
 
 class ArticleFactory(factory.django.DjangoModelFactory):
@@ -38,15 +32,9 @@ class ArticleFactory(factory.django.DjangoModelFactory):
     status = factory.Iterator(['draft', 'published', 'archived'])
     featured = factory.Faker('boolean', chance_of_getting_true=20)
     tags = factory.LazyFunction(lambda: ','.join(fake.words(nb=3)))
-    
-    @factory.post_generation
-    def view_count(self, create, extracted, **kwargs):
-        if not create:
-            return
-        if extracted:
-            self.view_count = extracted
-        elif self.status == 'published':
-            self.view_count = fake.random_int(min=0, max=1000)
+    view_count = factory.LazyAttribute(
+        lambda obj: fake.random_int(min=0, max=1000) if obj.status == 'published' else 0
+    )
 
 
 class PublishedArticleFactory(ArticleFactory):
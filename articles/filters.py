@@ -3,6 +3,20 @@ from django.db.models import Q
 from .models import Article
 
 
+def tag_match_q(tag):
+    """
+    Match articles carrying `tag` as a whole entry of their comma-separated
+    tags (case-insensitive), so "python" does not match "micropython".
+    Relies on tags being stored without spaces around the commas.
+    """
+    return (
+        Q(tags__iexact=tag) |
+        Q(tags__istartswith=f'{tag},') |
+        Q(tags__iendswith=f',{tag}') |
+        Q(tags__icontains=f',{tag},')
+    )
+
+
 class ArticleFilter(django_filters.FilterSet):
     """
     Advanced filtering for Article model.
@@ -109,24 +123,28 @@ class ArticleFilter(django_filters.FilterSet):
         if not value:
             return queryset
         
-        # Split tags and clean them
-        tags = [tag.strip().lower() for tag in value.split(',') if tag.strip()]
+        # Split tags, clean them and drop repeats so each one adds a single
+        # (trigram-indexed on PostgreSQL) set of predicates
+        tags = dict.fromkeys(tag.strip().lower() for tag in value.split(',') if tag.strip())
         
         # Create Q objects for each tag
         q_objects = Q()
         for tag in tags:
-            q_objects |= Q(tags__icontains=tag)
+            q_objects |= tag_match_q(tag)
         
         return queryset.filter(q_objects)
 
     def filter_search(self, queryset, name, value):
         """
         Perform a comprehensive search across multiple fields.
+        On PostgreSQL the title, content and tags predicates are served by
+        trigram indexes (see migrations 0003 and 0004).
         """
         if not value:
             return queryset
         
-        # Search across multiple fields
+        # Search across multiple fields. author is a single-valued foreign
+        # key, so the join cannot duplicate rows and no DISTINCT is needed.
         return queryset.filter(
             Q(title__icontains=value) |
             Q(content__icontains=value) |
@@ -134,7 +152,7 @@ class ArticleFilter(django_filters.FilterSet):
             Q(author__username__icontains=value) |
             Q(author__first_name__icontains=value) |
             Q(author__last_name__icontains=value)
-        ).distinct()
+        )
 
 
 class PublishedArticleFilter(ArticleFilter):
@@ -146,7 +164,7 @@ class PublishedArticleFilter(ArticleFilter):
     class Meta(ArticleFilter.Meta):
         model = Article
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Always filter for published articles
-        self.queryset = self.queryset.filter(status='published')
\ No newline at end of file
+    def filter_queryset(self, queryset):
+        # Always filter for published articles, in the same chain as the
+        # requested filters (served by the published_created_idx index)
+        return super().filter_queryset(queryset.filter(status='published'))
@@ -0,0 +1,35 @@
+"""
+Article list response caching.
+
+Cached list pages are keyed by a shared version that every write to the
+articles bumps (invalidate_article_lists), so a create, update or delete
+is visible in the very next list request instead of after
+ARTICLE_LIST_CACHE_SECONDS.
+"""
+import hashlib
+import time
+
+from django.core.cache import cache
+
+VERSION_KEY = 'article:list:version'
+
+
+def list_cache_key(request):
+    """
+    Build the cache key for a list request: the current version, the
+    caller (the list depends on who is asking) and the full path.
+    """
+    version = cache.get_or_set(VERSION_KEY, time.time_ns, timeout=None)
+    path = hashlib.md5(
+        request.get_full_path().encode(), usedforsecurity=False
+    ).hexdigest()
+    return f"article:list:{version}:{request.user.id or 'anon'}:{path}"
+
+
+def invalidate_article_lists():
+    """
+    Orphan every cached list page by moving to a new version.
+    A fresh timestamp rather than incr() so an evicted version can never
+    come back as one that old pages are still stored under.
+    """
+    cache.set(VERSION_KEY, time.time_ns(), timeout=None)
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from articles.view_counts import flush_view_counts
+
+
+class Command(BaseCommand):
+    help = 'Write buffered article view counts to the database.'
+
+    def handle(self, *args, **options):
+        count = flush_view_counts()
+        self.stdout.write(self.style.SUCCESS(f'Flushed view counts for {count} article(s).'))
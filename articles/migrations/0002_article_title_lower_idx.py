@@ -0,0 +1,18 @@
+# Generated by Django 5.0.7 on 2026-10-15 09:12
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(django.db.models.functions.text.Lower('title'), name='article_title_lower_idx'),
+        ),
+    ]
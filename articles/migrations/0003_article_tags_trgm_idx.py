@@ -0,0 +1,33 @@
+from django.db import migrations
+
+
+def create_tags_trigram_index(apps, schema_editor):
+    """
+    Index UPPER(tags) with pg_trgm so tags__icontains can use it.
+    Django renders icontains as UPPER(col::text) LIKE UPPER(%s) on
+    PostgreSQL; other backends have no equivalent and are skipped.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS article_tags_trgm_idx '
+        'ON articles_article USING gin (UPPER(tags::text) gin_trgm_ops)'
+    )
+
+
+def drop_tags_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS article_tags_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0002_article_title_lower_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_tags_trigram_index, drop_tags_trigram_index),
+    ]
@@ -0,0 +1,38 @@
+from django.db import migrations
+
+
+def create_search_trigram_indexes(apps, schema_editor):
+    """
+    Index UPPER(title) and UPPER(content) with pg_trgm so the icontains
+    predicates of the article search filter can use them. Skipped on
+    backends other than PostgreSQL.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS article_title_trgm_idx '
+        'ON articles_article USING gin (UPPER(title::text) gin_trgm_ops)'
+    )
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS article_content_trgm_idx '
+        'ON articles_article USING gin (UPPER(content::text) gin_trgm_ops)'
+    )
+
+
+def drop_search_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS article_title_trgm_idx')
+    schema_editor.execute('DROP INDEX IF EXISTS article_content_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0003_article_tags_trgm_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_trigram_indexes, drop_search_trigram_indexes),
+    ]
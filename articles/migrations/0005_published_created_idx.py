@@ -0,0 +1,17 @@
+# Generated by Django 5.0.7 on 2026-10-15 10:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0004_article_search_trgm_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('status', 'published')), fields=['-created_at'], name='published_created_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.7 on 2026-10-15 10:41
+
+from django.db import migrations, models
+
+
+def populate_word_count(apps, schema_editor):
+    Article = apps.get_model('articles', 'Article')
+    articles = []
+    for article in Article.objects.only('id', 'content').iterator(chunk_size=500):
+        article.word_count = len(article.content.split())
+        articles.append(article)
+    Article.objects.bulk_update(articles, ['word_count'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0005_published_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of words in the content (computed on save)'),
+        ),
+        migrations.RunPython(populate_word_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations
+
+
+def normalize_tags(apps, schema_editor):
+    Article = apps.get_model('articles', 'Article')
+    articles = []
+    for article in Article.objects.only('id', 'tags').exclude(tags='').iterator(chunk_size=500):
+        tags = ','.join(tag.strip() for tag in article.tags.split(',') if tag.strip())
+        if tags != article.tags:
+            article.tags = tags
+            articles.append(article)
+    Article.objects.bulk_update(articles, ['tags'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0007_article_list_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_tags, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.7 on 2026-10-15 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0008_normalize_article_tags'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='article',
+            name='articles_ar_feature_183843_idx',
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['featured', 'status', '-created_at'], name='featured_status_created_idx'),
+        ),
+    ]
@@ -1,4 +1,8 @@
+import re
+
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Lower
 from django.contrib.auth.models import User
 from django.utils.text import slugify
 from django.core.validators import MinLengthValidator
@@ -64,6 +68,12 @@ class Article(models.Model):
         help_text="Number of times article has been viewed"
     )
     
+    word_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of words in the content (computed on save)"
+    )
+    
     tags = models.CharField(
         max_length=200,
         blank=True,
@@ -92,8 +102,25 @@ class Article(models.Model):
         verbose_name_plural = 'Articles'
         indexes = [
             models.Index(fields=['status', 'created_at']),
-            models.Index(fields=['author', 'status']),
-            models.Index(fields=['featured']),
+            models.Index(fields=['status', '-published_at'], name='status_pub_idx'),
+            # Author's own articles, newest first (also serves author + status)
+            models.Index(
+                fields=['author', 'status', '-created_at'],
+                name='author_status_created_idx',
+            ),
+            # Featured published articles, newest first
+            models.Index(
+                fields=['featured', 'status', '-created_at'],
+                name='featured_status_created_idx',
+            ),
+            # Backs the case-insensitive duplicate title check
+            models.Index(Lower('title'), name='article_title_lower_idx'),
+            # Newest-first listing of public articles
+            models.Index(
+                fields=['-created_at'],
+                condition=Q(status='published'),
+                name='published_created_idx',
+            ),
         ]
 
     def __str__(self):
@@ -102,38 +129,77 @@ class Article(models.Model):
     def save(self, *args, **kwargs):
         """
         Override save method to auto-generate slug and excerpt.
+        Saves limited by update_fields only derive the fields they write,
+        so e.g. saving just 'featured' skips the slug query and the split.
         """
+        update_fields = kwargs.get('update_fields')
+        full_save = update_fields is None
+        update_fields = set(update_fields or ())
+        
         # Auto-generate slug from title if not provided
-        if not self.slug:
-            base_slug = slugify(self.title)
-            slug = base_slug
-            counter = 1
+        if not self.slug and (full_save or {'title', 'slug'} & update_fields):
+            self.slug = self._generate_unique_slug()
+            update_fields.add('slug')
+        
+        # Store tags as "a,b,c" so a tag can be matched as a whole token
+        if full_save or 'tags' in update_fields:
+            self.tags = ','.join(self.get_tags_list())
+        
+        if full_save or {'content', 'excerpt'} & update_fields:
+            words = self.content.split()
             
-            # Ensure slug uniqueness
-            while Article.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
+            # Auto-generate excerpt from content if not provided
+            if not self.excerpt:
+                # Take first 30 words and add ellipsis
+                self.excerpt = ' '.join(words[:30])
+                if len(words) > 30:
+                    self.excerpt += '...'
+                update_fields.add('excerpt')
             
-            self.slug = slug
-        
-        # Auto-generate excerpt from content if not provided
-        if not self.excerpt:
-            # Take first 150 words and add ellipsis
-            words = self.content.split()[:30]
-            self.excerpt = ' '.join(words)
-            if len(self.content.split()) > 30:
-                self.excerpt += '...'
+            # Store the word count so reads never re-tokenize the content
+            self.word_count = len(words)
+            update_fields.add('word_count')
         
+        if not full_save:
+            kwargs['update_fields'] = update_fields
         super().save(*args, **kwargs)
 
+    def _generate_unique_slug(self):
+        """
+        Build a unique slug from the title.
+        Fetches every taken variant of the base slug in a single query and
+        appends the next free counter instead of probing one suffix at a time.
+        """
+        # Titles without any ASCII letters or digits (e.g. non-Latin
+        # scripts) slugify to '', which would match every slug below
+        base_slug = slugify(self.title) or 'article'
+        suffix_pattern = rf'^{re.escape(base_slug)}-(\d+)$'
+        taken = Article.objects.filter(
+            Q(slug=base_slug) | Q(slug__regex=suffix_pattern)
+        ).exclude(pk=self.pk).values_list('slug', flat=True)
+        
+        suffix_re = re.compile(suffix_pattern)
+        base_taken = False
+        counters = []
+        for slug in taken:
+            if slug == base_slug:
+                base_taken = True
+            else:
+                match = suffix_re.match(slug)
+                if match:
+                    counters.append(int(match.group(1)))
+        
+        if not base_taken:
+            return base_slug
+        return f"{base_slug}-{max(counters, default=0) + 1}"
+
     @property
     def reading_time(self):
         """
         Calculate estimated reading time based on word count.
         Assumes average reading speed of 200 words per minute.
         """
-        word_count = len(self.content.split())
-        return max(1, round(word_count / 200))
+        return max(1, round(self.word_count / 200))
 
     def get_tags_list(self):
         """
@@ -1,8 +1,14 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import Value
+from django.db.models.functions import Lower
 from .models import Article
 from django.utils import timezone
 
+# How long a serialized list entry stays cached (seconds)
+ARTICLE_LIST_CACHE_TIMEOUT = 60 * 60
+
 
 class AuthorSerializer(serializers.ModelSerializer):
     """
@@ -20,15 +26,20 @@ class ArticleListSerializer(serializers.ModelSerializer):
     """
     Serializer for Article list view.
     Includes essential fields and computed properties for overview.
+    Author details are flattened onto the article instead of nesting an
+    AuthorSerializer per row; 'author' is the author's id.
     """
-    author = AuthorSerializer(read_only=True)
+    author_username = serializers.CharField(source='author.username', read_only=True)
+    author_first_name = serializers.CharField(source='author.first_name', read_only=True)
+    author_last_name = serializers.CharField(source='author.last_name', read_only=True)
     reading_time = serializers.ReadOnlyField()
     tags_list = serializers.ReadOnlyField(source='get_tags_list')
     
     class Meta:
         model = Article
         fields = [
-            'id', 'title', 'slug', 'excerpt', 'author', 'status', 
+            'id', 'title', 'slug', 'excerpt', 'author', 'author_username',
+            'author_first_name', 'author_last_name', 'status', 
             'featured', 'view_count', 'tags', 'tags_list', 
             'reading_time', 'created_at', 'updated_at', 'published_at'
         ]
@@ -37,6 +48,26 @@ class ArticleListSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at', 'published_at'
         ]
 
+    def to_representation(self, instance):
+        """
+        Serve the article from the cache while it is unchanged.
+        The key embeds updated_at, so any save yields a fresh entry.
+        view_count is bumped without touching updated_at, and the author
+        can be edited without touching the article at all, so those fields
+        are always taken from the instance.
+        """
+        represent = super().to_representation
+        key = f'article:list:{instance.pk}:{instance.updated_at.isoformat()}'
+        data = cache.get_or_set(
+            key, lambda: represent(instance), ARTICLE_LIST_CACHE_TIMEOUT
+        )
+        data['view_count'] = instance.view_count
+        author = instance.author
+        data['author_username'] = author.username
+        data['author_first_name'] = author.first_name
+        data['author_last_name'] = author.last_name
+        return data
+
 
 class ArticleDetailSerializer(serializers.ModelSerializer):
     """
@@ -49,7 +80,6 @@ class ArticleDetailSerializer(serializers.ModelSerializer):
     
     # Additional computed fields
     is_published = serializers.ReadOnlyField()
-    word_count = serializers.SerializerMethodField()
     
     class Meta:
         model = Article
@@ -64,10 +94,6 @@ class ArticleDetailSerializer(serializers.ModelSerializer):
             'word_count', 'is_published', 'created_at', 'updated_at'
         ]
 
-    def get_word_count(self, obj):
-        """Calculate word count for the article content."""
-        return len(obj.content.split()) if obj.content else 0
-
     def validate_title(self, value):
         """
         Validate article title.
@@ -75,9 +101,12 @@ class ArticleDetailSerializer(serializers.ModelSerializer):
         if len(value.strip()) < 5:
             raise serializers.ValidationError("Title must be at least 5 characters long.")
         
-        # Check for duplicate titles (case-insensitive)
+        # Check for duplicate titles (case-insensitive), matching the
+        # LOWER(title) expression index
         instance = getattr(self, 'instance', None)
-        existing = Article.objects.filter(title__iexact=value.strip())
+        existing = Article.objects.alias(title_lower=Lower('title')).filter(
+            title_lower=Lower(Value(value.strip()))
+        )
         if instance:
             existing = existing.exclude(pk=instance.pk)
         
@@ -99,20 +128,14 @@ class ArticleDetailSerializer(serializers.ModelSerializer):
         Validate and clean tags.
         """
         if value:
-            # Clean and validate tags
-            tags = [tag.strip().lower() for tag in value.split(',') if tag.strip()]
+            # Clean tags and remove duplicates while preserving order
+            tags = dict.fromkeys(
+                tag.strip().lower() for tag in value.split(',') if tag.strip()
+            )
             if len(tags) > 10:
                 raise serializers.ValidationError("Maximum 10 tags allowed.")
             
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_tags = []
-            for tag in tags:
-                if tag not in seen:
-                    seen.add(tag)
-                    unique_tags.append(tag)
-            
-            return ','.join(unique_tags)
+            return ','.join(tags)
         return value
 
     def validate(self, attrs):
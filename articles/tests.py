@@ -1,5 +1,11 @@
+import importlib
 import pytest
-from django.test import TestCase
+from io import StringIO
+from unittest import mock
+from django.core.cache import cache
+from django.core.management import call_command
+from django.contrib.admin.sites import AdminSite
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
 from django.contrib.auth.models import User
 from django.urls import reverse
 from rest_framework.test import APITestCase, APIClient
@@ -8,15 +14,19 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from django.utils import timezone
 import json
 
+from . import schema
+from .admin import ArticleAdmin
 from .models import Article
 from .serializers import ArticleDetailSerializer, ArticleListSerializer
+from .view_counts import _views_key, buffer_view, flush_view_counts, record_view
 
 
 class ArticleModelTest(TestCase):
     """Test Article model functionality."""
     
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123',
             email='test@example.com'
@@ -66,7 +76,52 @@ class ArticleModelTest(TestCase):
         
         self.assertEqual(article1.slug, 'same-title')
         self.assertEqual(article2.slug, 'same-title-1')
-        
+
+    def test_slug_uniqueness_uses_next_free_counter(self):
+        """Test slug suffix continues after the highest existing counter."""
+        for _ in range(3):
+            Article.objects.create(
+                title='Same Title',
+                content='Article content that is long enough.',
+                author=self.user
+            )
+        # A similar but distinct slug must not affect the counter
+        Article.objects.create(
+            title='Same Title Extended',
+            content='Article content that is long enough.',
+            author=self.user
+        )
+
+        article = Article.objects.create(
+            title='Same Title',
+            content='Article content that is long enough.',
+            author=self.user
+        )
+
+        self.assertEqual(article.slug, 'same-title-3')
+
+    def test_slug_for_title_without_ascii_characters(self):
+        """Test titles that slugify to nothing still get a usable slug."""
+        Article.objects.create(
+            title='Unrelated Article',
+            content='Article content that is long enough.',
+            author=self.user
+        )
+        first = Article.objects.create(
+            title='Привет мир',
+            content='Article content that is long enough.',
+            author=self.user
+        )
+        with self.assertNumQueries(2):  # Slug lookup + INSERT
+            second = Article.objects.create(
+                title='Привет мир',
+                content='Article content that is long enough.',
+                author=self.user
+            )
+
+        self.assertEqual(first.slug, 'article')
+        self.assertEqual(second.slug, 'article-1')
+
     def test_excerpt_auto_generation(self):
         """Test automatic excerpt generation."""
         long_content = ' '.join(['word'] * 50)  # 50 words
@@ -89,8 +144,27 @@ class ArticleModelTest(TestCase):
             author=self.user
         )
         
+        self.assertEqual(article.word_count, 200)
         self.assertEqual(article.reading_time, 1)  # 200 words / 200 wpm = 1 min
         
+    def test_save_with_update_fields_skips_derived_fields(self):
+        """Test partial saves only derive the fields they write."""
+        article = Article.objects.create(
+            title='Test Article',
+            content='Content here that meets minimum length requirement.',
+            author=self.user
+        )
+
+        article.featured = True
+        with self.assertNumQueries(1):  # Just the UPDATE
+            article.save(update_fields=['featured'])
+
+        article.content = 'Updated content with seven words in it.'
+        article.save(update_fields=['content'])
+        article.refresh_from_db()
+        self.assertEqual(article.word_count, 7)
+        self.assertTrue(article.featured)
+
     def test_get_tags_list(self):
         """Test tags parsing into list."""
         article = Article.objects.create(
@@ -102,96 +176,127 @@ class ArticleModelTest(TestCase):
         
         expected_tags = ['django', 'python', 'api', 'rest']
         self.assertEqual(article.get_tags_list(), expected_tags)
+        self.assertEqual(article.tags, 'django,python,api,rest')  # Normalized on save
         
-    def test_is_published(self):
-        """Test publication status check."""
-        draft_article = Article.objects.create(
-            title='Draft Article',
-            content='Content here that meets minimum length requirement.',
-            author=self.user,
-            status='draft'
-        )
-        
-        published_article = Article.objects.create(
-            title='Published Article',
-            content='Content here that meets minimum length requirement.',
-            author=self.user,
-            status='published'
-        )
-        
-        self.assertFalse(draft_article.is_published())
-        self.assertTrue(published_article.is_published())
-
 
 class ArticleAPITest(APITestCase):
     """Test Article API endpoints."""
     
-    def setUp(self):
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123',
             email='test@example.com'
         )
-        self.other_user = User.objects.create_user(
+        cls.other_user = User.objects.create_user(
             username='otheruser',
             password='testpass123',
             email='other@example.com'
         )
         
-        # Create test articles
-        self.published_article = Article.objects.create(
-            title='Published Test Article',
-            content='This is a published test article with enough content.',
-            author=self.user,
-            status='published',
-            tags='django,test'
-        )
-        
-        self.draft_article = Article.objects.create(
-            title='Draft Test Article',
-            content='This is a draft test article with enough content.',
-            author=self.user,
-            status='draft',
-            tags='django,draft'
-        )
-        
-    def get_jwt_token(self, user):
-        """Helper method to get JWT token for user."""
-        refresh = RefreshToken.for_user(user)
-        return str(refresh.access_token)
+        # Create test articles in one INSERT; bulk_create bypasses save(),
+        # so the derived slug, excerpt and word count are given explicitly
+        published_content = 'This is a published test article with enough content.'
+        draft_content = 'This is a draft test article with enough content.'
+        cls.published_article, cls.draft_article = Article.objects.bulk_create([
+            Article(
+                title='Published Test Article',
+                slug='published-test-article',
+                content=published_content,
+                excerpt=published_content,
+                word_count=len(published_content.split()),
+                author=cls.user,
+                status='published',
+                tags='django,test'
+            ),
+            Article(
+                title='Draft Test Article',
+                slug='draft-test-article',
+                content=draft_content,
+                excerpt=draft_content,
+                word_count=len(draft_content.split()),
+                author=cls.user,
+                status='draft',
+                tags='django,draft'
+            ),
+        ])
+    
+    def setUp(self):
+        # Cached view counts and responses must not leak between tests
+        cache.clear()
+        self.client = APIClient()
         
     def test_list_articles_anonymous(self):
         """Test listing articles as anonymous user (only published)."""
         url = reverse('article-list')
-        response = self.client.get(url)
+        # COUNT for pagination + one SELECT joined to the author
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 1)  # Only published
         self.assertEqual(response.data['results'][0]['title'], 'Published Test Article')
+        self.assertEqual(response.data['results'][0]['author'], self.user.pk)
+        self.assertEqual(response.data['results'][0]['author_username'], 'testuser')
         
     def test_list_articles_authenticated(self):
         """Test listing articles as authenticated user (own drafts + published)."""
-        token = self.get_jwt_token(self.user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.client.force_authenticate(user=self.user)
         
         url = reverse('article-list')
-        response = self.client.get(url)
+        # COUNT + SELECT
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 2)  # Both articles visible
+
+    def test_list_articles_with_jwt(self):
+        """Test a real JWT access token authenticates the request."""
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        
+        url = reverse('article-list')
+        # Token user lookup + COUNT + SELECT
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 2)  # Own draft visible
         
     def test_retrieve_article(self):
         """Test retrieving a specific article."""
         url = reverse('article-detail', kwargs={'pk': self.published_article.pk})
-        response = self.client.get(url)
+        # SELECT + view count UPDATE, no re-read of the row
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['title'], 'Published Test Article')
+        self.assertEqual(response.data['view_count'], 1)
         
         # Check if view count was incremented
         self.published_article.refresh_from_db()
         self.assertEqual(self.published_article.view_count, 1)
+
+    @override_settings(ARTICLE_VIEW_COUNT_BUFFER=True)
+    def test_retrieve_article_buffers_view_count(self):
+        """Test buffered views are reported and only persisted on flush."""
+        url = reverse('article-detail', kwargs={'pk': self.published_article.pk})
+        self.client.get(url)
+        response = self.client.get(url)
+
+        self.assertEqual(response.data['view_count'], 2)
+        self.published_article.refresh_from_db()
+        self.assertEqual(self.published_article.view_count, 0)
+
+        # The first run closes the generation, the second writes it back
+        call_command('flush_view_counts', stdout=StringIO())
+        call_command('flush_view_counts', stdout=StringIO())
+
+        self.published_article.refresh_from_db()
+        self.assertEqual(self.published_article.view_count, 2)
         
     def test_create_article_anonymous(self):
         """Test creating article as anonymous user (should fail)."""
@@ -207,8 +312,7 @@ class ArticleAPITest(APITestCase):
         
     def test_create_article_authenticated(self):
         """Test creating article as authenticated user."""
-        token = self.get_jwt_token(self.user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.client.force_authenticate(user=self.user)
         
         url = reverse('article-list')
         data = {
@@ -225,8 +329,7 @@ class ArticleAPITest(APITestCase):
         
     def test_update_own_article(self):
         """Test updating own article."""
-        token = self.get_jwt_token(self.user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.client.force_authenticate(user=self.user)
         
         url = reverse('article-detail', kwargs={'pk': self.draft_article.pk})
         data = {'title': 'Updated Article Title'}
@@ -237,19 +340,27 @@ class ArticleAPITest(APITestCase):
         
     def test_update_other_user_article(self):
         """Test updating another user's article (should fail)."""
-        token = self.get_jwt_token(self.other_user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.client.force_authenticate(user=self.other_user)
         
-        url = reverse('article-detail', kwargs={'pk': self.draft_article.pk})
+        url = reverse('article-detail', kwargs={'pk': self.published_article.pk})
         data = {'title': 'Hacked Title'}
         response = self.client.patch(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         
+    def test_update_other_user_draft(self):
+        """Test another user's draft is hidden rather than forbidden."""
+        self.client.force_authenticate(user=self.other_user)
+        
+        url = reverse('article-detail', kwargs={'pk': self.draft_article.pk})
+        data = {'title': 'Hacked Title'}
+        response = self.client.patch(url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        
     def test_delete_own_article(self):
         """Test deleting own article."""
-        token = self.get_jwt_token(self.user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.client.force_authenticate(user=self.user)
         
         url = reverse('article-detail', kwargs={'pk': self.draft_article.pk})
         response = self.client.delete(url)
@@ -257,6 +368,48 @@ class ArticleAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(Article.objects.filter(pk=self.draft_article.pk).exists())
         
+    def test_list_is_served_from_cache(self):
+        """Test a repeated list request skips the database and client caches."""
+        self.client.force_authenticate(user=self.user)
+        url = reverse('article-list')
+        self.client.get(url)
+        
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 2)
+        self.assertFalse(response.has_header('Cache-Control'))
+        
+    def test_create_then_list(self):
+        """Test a created article shows up in the author's cached list."""
+        self.client.force_authenticate(user=self.user)
+        url = reverse('article-list')
+        self.assertEqual(self.client.get(url).data['count'], 2)
+        
+        data = {
+            'title': 'Freshly Created Article',
+            'content': 'New article content that meets minimum requirements and is long enough.',
+            'status': 'draft',
+        }
+        response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        
+        response = self.client.get(url)
+        self.assertEqual(response.data['count'], 3)
+        
+    def test_delete_then_list(self):
+        """Test a deleted article leaves every cached list at once."""
+        url = reverse('article-list')
+        self.assertEqual(self.client.get(url).data['count'], 1)  # Anonymous
+        
+        self.client.force_authenticate(user=self.user)
+        detail_url = reverse('article-detail', kwargs={'pk': self.published_article.pk})
+        self.client.delete(detail_url)
+        self.client.force_authenticate(user=None)
+        
+        self.assertEqual(self.client.get(url).data['count'], 0)
+        
     def test_search_articles(self):
         """Test searching articles."""
         url = reverse('article-list')
@@ -268,8 +421,7 @@ class ArticleAPITest(APITestCase):
         
     def test_filter_articles_by_status(self):
         """Test filtering articles by status."""
-        token = self.get_jwt_token(self.user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.client.force_authenticate(user=self.user)
         
         url = reverse('article-list')
         response = self.client.get(url, {'status': 'draft'})
@@ -277,6 +429,21 @@ class ArticleAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 1)
         self.assertEqual(response.data['results'][0]['status'], 'draft')
+
+    def test_filter_articles_by_status_hides_other_users_drafts(self):
+        """Test status filters only expose other users' published articles."""
+        self.client.force_authenticate(user=self.other_user)
+        
+        url = reverse('article-list')
+        response = self.client.get(url, {'status': 'draft'})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 0)
+
+        response = self.client.get(url, {'status': 'published'})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
         
     def test_order_articles(self):
         """Test ordering articles."""
@@ -301,11 +468,12 @@ class ArticleAPITest(APITestCase):
         
     def test_my_articles_endpoint(self):
         """Test my articles custom endpoint."""
-        token = self.get_jwt_token(self.user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.client.force_authenticate(user=self.user)
         
         url = reverse('article-my-articles')
-        response = self.client.get(url)
+        # COUNT + SELECT
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 2)  # Both user's articles
@@ -313,7 +481,9 @@ class ArticleAPITest(APITestCase):
     def test_articles_by_author_endpoint(self):
         """Test articles by author endpoint."""
         url = reverse('article-by-author')
-        response = self.client.get(url, {'author': 'testuser'})
+        # COUNT + SELECT
+        with self.assertNumQueries(2):
+            response = self.client.get(url, {'author': 'testuser'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 1)  # Only published ones
@@ -321,30 +491,270 @@ class ArticleAPITest(APITestCase):
     def test_articles_by_tag_endpoint(self):
         """Test articles by tag endpoint."""
         url = reverse('article-by-tag')
-        response = self.client.get(url, {'tag': 'django'})
+        # COUNT + SELECT
+        with self.assertNumQueries(2):
+            response = self.client.get(url, {'tag': 'django'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 1)  # Only published with django tag
+
+    def test_articles_by_tag_matches_whole_tags(self):
+        """Test tag lookups do not match tags that merely contain the tag."""
+        Article.objects.create(
+            title='MicroPython Article',
+            content='This article is about running Python on microcontrollers.',
+            author=self.user,
+            status='published',
+            tags='micropython, embedded'
+        )
+        Article.objects.create(
+            title='Python Article',
+            content='This article is about the Python programming language.',
+            author=self.user,
+            status='published',
+            tags='web, Python, tips'
+        )
+
+        response = self.client.get(reverse('article-by-tag'), {'tag': 'python'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        titles = [article['title'] for article in response.data['results']]
+        self.assertEqual(titles, ['Python Article'])
         
     def test_article_stats_endpoint(self):
         """Test article statistics endpoint."""
         url = reverse('article-stats')
-        response = self.client.get(url)
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('total_articles', response.data)
         self.assertIn('published_articles', response.data)
         self.assertIn('draft_articles', response.data)
+        self.assertEqual(response.data['total_articles'], 1)  # Only published
+        self.assertEqual(response.data['total_views'], 0)
+        self.assertNotIn('my_articles', response.data)
+
+        # Repeated requests are answered from the cache
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+    def test_article_stats_endpoint_authenticated(self):
+        """Test statistics include the user's own article counts."""
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(reverse('article-stats'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_articles'], 2)
+        self.assertEqual(response.data['draft_articles'], 1)
+        self.assertEqual(response.data['my_articles'], 2)
+        self.assertEqual(response.data['my_published'], 1)
+        self.assertEqual(response.data['my_drafts'], 1)
         
         
+class ArticleAdminActionTest(TestCase):
+    """Test the bulk actions of the article admin."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        cls.featured, cls.plain = (
+            Article.objects.create(
+                title=title,
+                content='Content here that meets minimum length requirement.',
+                author=cls.user,
+                status='draft',
+                featured=featured
+            )
+            for title, featured in (('Featured Article', True), ('Plain Article', False))
+        )
+
+    def setUp(self):
+        self.model_admin = ArticleAdmin(Article, AdminSite())
+        self.request = RequestFactory().post('/admin/articles/article/')
+        self.messages = []
+        self.model_admin.message_user = (
+            lambda request, message: self.messages.append(message)
+        )
+
+    def test_toggle_featured_flips_mixed_selection(self):
+        """Test both directions are flipped by one UPDATE."""
+        queryset = Article.objects.filter(pk__in=[self.featured.pk, self.plain.pk])
+
+        with self.assertNumQueries(1):
+            self.model_admin.toggle_featured(self.request, queryset)
+
+        self.assertEqual(self.messages, ['Featured status toggled for 2 article(s).'])
+        self.featured.refresh_from_db()
+        self.plain.refresh_from_db()
+        self.assertFalse(self.featured.featured)
+        self.assertTrue(self.plain.featured)
+
+    def test_actions_move_updated_at(self):
+        """Test every action bumps updated_at, which keys cached list entries."""
+        queryset = Article.objects.filter(pk=self.plain.pk)
+        for action in ('toggle_featured', 'mark_as_published', 'mark_as_draft'):
+            with self.subTest(action=action):
+                before = Article.objects.get(pk=self.plain.pk).updated_at
+                getattr(self.model_admin, action)(self.request, queryset)
+                self.assertGreater(
+                    Article.objects.get(pk=self.plain.pk).updated_at, before
+                )
+        self.assertEqual(self.messages[1], '1 article(s) marked as published.')
+
+
+class ViewCountBufferTest(TestCase):
+    """Test buffering article views in the cache."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        cls.first, cls.second = (
+            Article.objects.create(
+                title=f'Buffered Article {n}',
+                content='Content here that meets minimum length requirement.',
+                author=cls.user,
+                status='published'
+            )
+            for n in (1, 2)
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_flush_persists_every_buffered_article(self):
+        """Test views buffered for different articles are all flushed."""
+        buffer_view(self.first.pk)
+        buffer_view(self.second.pk)
+        buffer_view(self.second.pk)
+
+        self.assertEqual(flush_view_counts(), 0)  # Closes the generation
+        self.assertEqual(flush_view_counts(), 2)
+
+        self.first.refresh_from_db()
+        self.second.refresh_from_db()
+        self.assertEqual(self.first.view_count, 1)
+        self.assertEqual(self.second.view_count, 2)
+        self.assertEqual(flush_view_counts(), 0)  # Nothing left to flush
+
+    def test_flush_only_visits_viewed_articles(self):
+        """Test flushing costs one UPDATE per viewed article, not per row."""
+        buffer_view(self.first.pk)
+        flush_view_counts()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(flush_view_counts(), 1)
+
+    def test_views_during_and_after_flush_are_kept(self):
+        """Test views arriving while a generation is written back all land."""
+        for _ in range(3):
+            buffer_view(self.first.pk)
+        flush_view_counts()
+        real_get_many = cache.get_many
+        arrived = []
+
+        def get_many_then_view(keys):
+            values = real_get_many(keys)
+            if not arrived:
+                arrived.append(buffer_view(self.first.pk))  # During the flush
+            return values
+
+        with mock.patch.object(cache, 'get_many', side_effect=get_many_then_view):
+            flush_view_counts()
+        buffer_view(self.first.pk)  # After the flush
+
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.view_count, 3)
+
+        flush_view_counts()
+        flush_view_counts()
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.view_count, 5)
+
+        # Later views are still counted, not swallowed by a stale counter
+        buffer_view(self.first.pk)
+        flush_view_counts()
+        flush_view_counts()
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.view_count, 6)
+
+    def test_recreated_counter_is_flushed_once(self):
+        """Test an article listed twice in the dirty index is added once."""
+        buffer_view(self.first.pk)
+        cache.delete(_views_key(1, self.first.pk))  # Evicted
+        buffer_view(self.first.pk)  # Re-created and listed again
+        buffer_view(self.first.pk)
+
+        flush_view_counts()
+        self.assertEqual(flush_view_counts(), 1)
+
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.view_count, 2)
+
+
+class RecordViewTest(SimpleTestCase):
+    """Test counting a view directly in the database."""
+
+    def test_postgresql_reads_count_back_with_returning(self):
+        """Test PostgreSQL increments and reads the count in one statement."""
+        article = Article(pk=7, view_count=3)
+        connection = mock.MagicMock(vendor='postgresql')
+        connection.ops.quote_name = lambda name: f'"{name}"'
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = (42,)
+
+        with mock.patch('articles.view_counts.connection', connection):
+            record_view(article)
+
+        cursor.execute.assert_called_once_with(
+            'UPDATE "articles_article" SET "view_count" = "view_count" + 1 '
+            'WHERE "id" = %s RETURNING "view_count"',
+            [7],
+        )
+        self.assertEqual(article.view_count, 42)  # Value stored, not 3 + 1
+
+
+class SchemaAnnotationTest(SimpleTestCase):
+    """Test the OpenAPI annotations are skipped when the docs are off."""
+
+    def test_annotations_are_no_ops_without_docs(self):
+        """Test the stand-ins return what they decorate unchanged."""
+        self.addCleanup(importlib.reload, schema)
+        with override_settings(ENABLE_API_DOCS=False):
+            importlib.reload(schema)
+
+        def view():
+            pass
+
+        decorated = schema.extend_schema(
+            parameters=[schema.OpenApiParameter(
+                name='tag', type=schema.OpenApiTypes.STR,
+                location=schema.OpenApiParameter.QUERY,
+            )],
+        )(view)
+        self.assertIs(decorated, view)
+        self.assertIs(schema.extend_schema_view(list=decorated)(view), view)
+        self.assertNotIn('drf_spectacular', schema.extend_schema.__module__)
+
+
 class ArticleSerializerTest(TestCase):
     """Test Article serializers."""
     
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
+    
+    def setUp(self):
         self.article_data = {
             'title': 'Test Article',
             'content': 'Test content that meets minimum length requirements.',
@@ -366,27 +776,49 @@ class ArticleSerializerTest(TestCase):
         self.assertEqual(data['author']['username'], 'testuser')
         self.assertIn('reading_time', data)
         self.assertIn('word_count', data)
-        
-    def test_title_validation(self):
-        """Test title validation."""
-        # Test short title
+
+    def test_list_serialization_cache_follows_changes(self):
+        """Test cached list entries pick up saves and view count bumps."""
+        article = Article.objects.create(author=self.user, **self.article_data)
+        self.assertEqual(ArticleListSerializer(article).data['title'], 'Test Article')
+
+        Article.objects.filter(pk=article.pk).update(view_count=5)
+        article.refresh_from_db()
+        self.assertEqual(ArticleListSerializer(article).data['view_count'], 5)
+
+        article.title = 'Renamed Test Article'
+        article.save()
+        self.assertEqual(ArticleListSerializer(article).data['title'], 'Renamed Test Article')
+
+    def test_list_serialization_cache_follows_author_changes(self):
+        """Test cached list entries pick up edits to the author."""
+        article = Article.objects.create(author=self.user, **self.article_data)
+        self.assertEqual(ArticleListSerializer(article).data['author_first_name'], '')
+
+        self.user.first_name = 'Renamed'
+        self.user.username = 'renameduser'
+        self.user.save()
+        article = Article.objects.select_related('author').get(pk=article.pk)
+
+        data = ArticleListSerializer(article).data
+        self.assertEqual(data['author_first_name'], 'Renamed')
+        self.assertEqual(data['author_username'], 'renameduser')
+
+    def test_duplicate_title_validation(self):
+        """Test duplicate titles are rejected regardless of case."""
+        article = Article.objects.create(author=self.user, **self.article_data)
+
         data = self.article_data.copy()
-        data['title'] = 'Hi'  # Too short
-        
+        data['title'] = 'TEST article'
+
         serializer = ArticleDetailSerializer(data=data)
         self.assertFalse(serializer.is_valid())
         self.assertIn('title', serializer.errors)
-        
-    def test_content_validation(self):
-        """Test content validation."""
-        # Test short content
-        data = self.article_data.copy()
-        data['content'] = 'Short'  # Too short
-        
-        serializer = ArticleDetailSerializer(data=data)
-        self.assertFalse(serializer.is_valid())
-        self.assertIn('content', serializer.errors)
-        
+
+        # Updating the article itself keeps its own title valid
+        serializer = ArticleDetailSerializer(article, data=data)
+        self.assertTrue(serializer.is_valid())
+
     def test_tags_validation(self):
         """Test tags validation and cleaning."""
         data = self.article_data.copy()
@@ -416,3 +848,32 @@ class TestArticleAPI:
         assert article.title == 'Factory Article'
         assert article.author.username == 'factoryuser'
         assert article.is_published() == True
+
+
+@pytest.mark.parametrize('status_value,expected', [
+    ('draft', False),
+    ('published', True),
+    ('archived', False),
+])
+def test_is_published(status_value, expected):
+    """Test publication status check."""
+    assert Article(status=status_value).is_published() is expected
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('field,bad_value', [
+    ('title', 'Hi'),
+    ('content', 'Short'),
+])
+def test_article_field_validation(field, bad_value):
+    """Test too-short titles and content are rejected."""
+    data = {
+        'title': 'Test Article',
+        'content': 'Test content that meets minimum length requirements.',
+        'status': 'published',
+        field: bad_value,
+    }
+
+    serializer = ArticleDetailSerializer(data=data)
+    assert not serializer.is_valid()
+    assert field in serializer.errors
@@ -6,13 +6,10 @@ from .views import ArticleViewSet
 router = DefaultRouter()
 router.register(r'articles', ArticleViewSet, basename='article')
 
-# URL patterns for the articles app
+# URL patterns for the articles app (mounted under /api/ by config/urls.py)
 urlpatterns = [
     # DRF router URLs
-    path('api/', include(router.urls)),
-    
-    # Alternative: if you want articles directly under /api/ without the app prefix
-    # path('', include(router.urls)),
+    path('', include(router.urls)),
 ]
 
 # Available endpoints:
@@ -0,0 +1,139 @@
+"""
+Article view counting.
+
+Views are normally added to the database one at a time (record_view).
+With ARTICLE_VIEW_COUNT_BUFFER enabled, they are counted in the cache
+instead and written back in batches by the ``flush_view_counts``
+management command (schedule it, e.g. every minute). Counters are kept
+per generation; every run of the command starts a new generation and
+writes back the one before.
+"""
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import F
+
+from .models import Article
+
+# Generation that newly buffered views are counted in
+GENERATION_KEY = 'article:views:generation'
+
+# How many counters are read from the cache per get_many() while flushing
+FLUSH_BATCH_SIZE = 500
+
+
+def record_view(article):
+    """
+    Add one view to an article in the database and update the instance.
+    On PostgreSQL the new count comes back from UPDATE ... RETURNING in the
+    same round trip; elsewhere the instance is incremented locally.
+    """
+    if connection.vendor == 'postgresql':
+        qn = connection.ops.quote_name
+        table = qn(Article._meta.db_table)
+        column = qn(Article._meta.get_field('view_count').column)
+        pk_column = qn(Article._meta.pk.column)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {table} SET {column} = {column} + 1 '
+                f'WHERE {pk_column} = %s RETURNING {column}',
+                [article.pk],
+            )
+            row = cursor.fetchone()
+        if row is not None:
+            article.view_count = row[0]
+        return
+    
+    Article.objects.filter(pk=article.pk).update(
+        view_count=F('view_count') + 1
+    )
+    # Mirror the increment instead of re-reading the row
+    article.view_count += 1
+
+
+def _generation():
+    return cache.get_or_set(GENERATION_KEY, 1, timeout=None)
+
+
+def _views_key(generation, pk):
+    return f'article:views:{generation}:{pk}'
+
+
+def _dirty_count_key(generation):
+    return f'article:views:{generation}:dirty'
+
+
+def _dirty_key(generation, slot):
+    return f'article:views:{generation}:dirty:{slot}'
+
+
+def _increment(key):
+    """
+    Atomically add one to a counter, creating it if needed.
+    Returns the new value.
+    """
+    if cache.add(key, 1, timeout=None):
+        return 1
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # The counter was evicted between add() and incr()
+        cache.set(key, 1, timeout=None)
+        return 1
+
+
+def buffer_view(pk):
+    """
+    Count one view of an article in the current generation.
+    Returns the number of views buffered for it in that generation.
+    The first view of an article in a generation also records its pk in
+    the generation's dirty index, so flushing only visits articles that
+    were actually viewed. Only atomic cache operations are used, so
+    concurrent workers never overwrite each other's views.
+    """
+    generation = _generation()
+    views = _increment(_views_key(generation, pk))
+    if views == 1:
+        slot = _increment(_dirty_count_key(generation))
+        cache.set(_dirty_key(generation, slot), pk, timeout=None)
+    return views
+
+
+def flush_view_counts():
+    """
+    Add buffered views to the database, one UPDATE per viewed article.
+    Each run closes the current generation, so new views start counting
+    in a fresh one, and writes back the generation closed by the previous
+    run. A view that looked up the generation just before it was closed
+    therefore has a whole interval to land before its counter is read,
+    and closed counters are read once and deleted, never decremented.
+    Buffered views reach the database on the second run after them.
+    Returns the number of articles updated.
+    """
+    cache.add(GENERATION_KEY, 1, timeout=None)
+    closed = cache.incr(GENERATION_KEY) - 1
+    return _flush_generation(closed - 1)
+
+
+def _flush_generation(generation):
+    count_key = _dirty_count_key(generation)
+    slot_keys = [
+        _dirty_key(generation, slot)
+        for slot in range(1, (cache.get(count_key) or 0) + 1)
+    ]
+    flushed = 0
+    for start in range(0, len(slot_keys), FLUSH_BATCH_SIZE):
+        batch = slot_keys[start:start + FLUSH_BATCH_SIZE]
+        keys = {
+            _views_key(generation, pk): pk
+            for pk in cache.get_many(batch).values()
+        }
+        for key, views in cache.get_many(keys).items():
+            Article.objects.filter(pk=keys[key]).update(
+                view_count=F('view_count') + views
+            )
+            flushed += 1
+        # A pk listed twice (its counter was evicted and re-created) finds
+        # its counter gone the second time, so it is never added twice
+        cache.delete_many([*batch, *keys])
+    cache.delete(count_key)
+    return flushed
@@ -3,10 +3,11 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q, F
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
-from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
-from drf_spectacular.types import OpenApiTypes
 
 from .models import Article
 from .serializers import (
@@ -15,8 +16,18 @@ from .serializers import (
     ArticleCreateSerializer,
     ArticleUpdateSerializer
 )
-from .filters import ArticleFilter
+from .filters import ArticleFilter, tag_match_q
+from .list_cache import invalidate_article_lists, list_cache_key
 from .permissions import IsAuthorOrReadOnly
+from .schema import OpenApiParameter, OpenApiTypes, extend_schema, extend_schema_view
+from .view_counts import buffer_view, record_view
+
+
+# Seconds a user's stats response is served from the cache
+STATS_CACHE_TIMEOUT = 60
+
+# Base queryset for every endpoint; only ever cloned by filter()/all()
+ARTICLES = Article.objects.select_related('author')
 
 
 @extend_schema_view(
@@ -64,7 +75,6 @@ class ArticleViewSet(viewsets.ModelViewSet):
     - Additional actions for featured articles, user articles, etc.
     """
     
-    queryset = Article.objects.select_related('author').all()
     permission_classes = [IsAuthenticatedOrReadOnly, IsAuthorOrReadOnly]
     
     # Search, filter, and ordering configuration
@@ -98,20 +108,52 @@ class ArticleViewSet(viewsets.ModelViewSet):
         """
         Customize queryset based on user permissions and filters.
         """
-        queryset = self.queryset
+        user = self.request.user
         
-        # If user is not authenticated, only show published articles
-        if not self.request.user.is_authenticated:
-            queryset = queryset.filter(status='published')
+        if not user.is_authenticated:
+            # Anonymous users only see published articles
+            queryset = ARTICLES.filter(status='published')
+        elif user.is_staff:
+            queryset = ARTICLES.all()
+        elif self.action == 'list' and self.request.query_params.get('status'):
+            # ArticleFilter narrows the list to one status anyway, so resolve
+            # the visibility OR up front: only published articles are public,
+            # any other status can only match the user's own articles
+            status_param = self.request.query_params['status']
+            if status_param == 'published':
+                queryset = ARTICLES.filter(status='published')
+            else:
+                queryset = ARTICLES.filter(author=user, status=status_param)
         else:
             # Authenticated users can see their own drafts + all published
-            if not self.request.user.is_staff:
-                queryset = queryset.filter(
-                    Q(status='published') | Q(author=self.request.user)
-                )
+            queryset = ARTICLES.filter(Q(status='published') | Q(author=user))
+        
+        # The list serializer never reads the (potentially large) content
+        if self.action == 'list':
+            queryset = queryset.defer('content')
         
         return queryset
     
+    def list(self, request, *args, **kwargs):
+        """
+        List articles, serving repeated requests (e.g. paging through one
+        search) from the cache for ARTICLE_LIST_CACHE_SECONDS.
+        """
+        timeout = settings.ARTICLE_LIST_CACHE_SECONDS
+        if not timeout:
+            return super().list(request, *args, **kwargs)
+        
+        # Only the data is cached; no Cache-Control is sent, so clients
+        # never hold on to a page the server has already invalidated
+        key = list_cache_key(request)
+        data = cache.get(key)
+        if data is None:
+            response = super().list(request, *args, **kwargs)
+            cache.set(key, response.data, timeout)
+            return response
+        
+        return Response(data)
+    
     def retrieve(self, request, *args, **kwargs):
         """
         Retrieve single article and increment view count.
@@ -120,20 +162,61 @@ class ArticleViewSet(viewsets.ModelViewSet):
         
         # Increment view count (only for published articles)
         if instance.status == 'published':
-            Article.objects.filter(pk=instance.pk).update(
-                view_count=F('view_count') + 1
-            )
-            # Refresh instance to get updated view_count
-            instance.refresh_from_db()
+            if settings.ARTICLE_VIEW_COUNT_BUFFER:
+                # Count the view in the cache; flush_view_counts persists it
+                instance.view_count += buffer_view(instance.pk)
+            else:
+                record_view(instance)
         
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
     
+    def _compute_stats(self, user):
+        """
+        Aggregate the article statistics visible to `user`.
+        """
+        queryset = self.get_queryset()
+        
+        # One conditional aggregate instead of a query per figure
+        aggregates = {
+            'total_articles': Count('id'),
+            'published_articles': Count('id', filter=Q(status='published')),
+            'draft_articles': Count('id', filter=Q(status='draft')),
+            'featured_articles': Count('id', filter=Q(featured=True)),
+            'total_views': Coalesce(Sum('view_count'), 0),
+        }
+        
+        # Add user-specific stats if authenticated
+        if user.is_authenticated:
+            mine = Q(author=user)
+            aggregates.update({
+                'my_articles': Count('id', filter=mine),
+                'my_published': Count('id', filter=mine & Q(status='published')),
+                'my_drafts': Count('id', filter=mine & Q(status='draft')),
+            })
+        
+        return queryset.aggregate(**aggregates)
+    
+    def _paginated_list(self, queryset):
+        """
+        Paginate and serialize a queryset for the list-style actions.
+        """
+        # Like list, these actions never read the content column
+        queryset = queryset.defer('content')
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = ArticleListSerializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        
+        serializer = ArticleListSerializer(queryset, many=True)
+        return Response(serializer.data)
+    
     def perform_create(self, serializer):
         """
         Create article with current user as author.
         """
         serializer.save(author=self.request.user)
+        invalidate_article_lists()
     
     def perform_update(self, serializer):
         """
@@ -146,6 +229,14 @@ class ArticleViewSet(viewsets.ModelViewSet):
             serializer.save(published_at=timezone.now())
         else:
             serializer.save()
+        invalidate_article_lists()
+    
+    def perform_destroy(self, instance):
+        """
+        Delete article and drop the cached list pages showing it.
+        """
+        instance.delete()
+        invalidate_article_lists()
     
     @extend_schema(
         summary="Featured Articles",
@@ -163,14 +254,7 @@ class ArticleViewSet(viewsets.ModelViewSet):
             status='published'
         )
         
-        # Apply pagination
-        page = self.paginate_queryset(featured_articles)
-        if page is not None:
-            serializer = ArticleListSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = ArticleListSerializer(featured_articles, many=True)
-        return Response(serializer.data)
+        return self._paginated_list(featured_articles)
     
     @extend_schema(
         summary="My Articles",
@@ -189,18 +273,11 @@ class ArticleViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        user_articles = Article.objects.select_related('author').filter(
+        user_articles = ARTICLES.filter(
             author=request.user
         )
         
-        # Apply pagination
-        page = self.paginate_queryset(user_articles)
-        if page is not None:
-            serializer = ArticleListSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = ArticleListSerializer(user_articles, many=True)
-        return Response(serializer.data)
+        return self._paginated_list(user_articles)
     
     @extend_schema(
         summary="Articles by Author",
@@ -229,19 +306,14 @@ class ArticleViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        author_articles = self.get_queryset().filter(
+        # Only published articles are shown, so the visibility rules in
+        # get_queryset() would only add a redundant OR branch
+        author_articles = ARTICLES.filter(
             author__username=author_username,
             status='published'  # Only show published articles for public view
         )
         
-        # Apply pagination
-        page = self.paginate_queryset(author_articles)
-        if page is not None:
-            serializer = ArticleListSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = ArticleListSerializer(author_articles, many=True)
-        return Response(serializer.data)
+        return self._paginated_list(author_articles)
     
     @extend_schema(
         summary="Articles by Tag",
@@ -270,20 +342,13 @@ class ArticleViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Case-insensitive tag search
-        tagged_articles = self.get_queryset().filter(
-            tags__icontains=tag,
+        # Case-insensitive match on whole tags only
+        tagged_articles = ARTICLES.filter(
+            tag_match_q(tag.strip()),
             status='published'
         )
         
-        # Apply pagination
-        page = self.paginate_queryset(tagged_articles)
-        if page is not None:
-            serializer = ArticleListSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = ArticleListSerializer(tagged_articles, many=True)
-        return Response(serializer.data)
+        return self._paginated_list(tagged_articles)
     
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated])
     def toggle_featured(self, request, pk=None):
@@ -299,7 +364,9 @@ class ArticleViewSet(viewsets.ModelViewSet):
         
         article = self.get_object()
         article.featured = not article.featured
-        article.save(update_fields=['featured'])
+        # Include updated_at so cached list entries for the article expire
+        article.save(update_fields=['featured', 'updated_at'])
+        invalidate_article_lists()
         
         return Response({
             'featured': article.featured,
@@ -317,23 +384,11 @@ class ArticleViewSet(viewsets.ModelViewSet):
         Get article statistics.
         GET /api/articles/stats/
         """
-        queryset = self.get_queryset()
-        
-        stats = {
-            'total_articles': queryset.count(),
-            'published_articles': queryset.filter(status='published').count(),
-            'draft_articles': queryset.filter(status='draft').count(),
-            'featured_articles': queryset.filter(featured=True).count(),
-            'total_views': sum(queryset.values_list('view_count', flat=True)),
-        }
-        
-        # Add user-specific stats if authenticated
-        if request.user.is_authenticated:
-            user_articles = queryset.filter(author=request.user)
-            stats.update({
-                'my_articles': user_articles.count(),
-                'my_published': user_articles.filter(status='published').count(),
-                'my_drafts': user_articles.filter(status='draft').count(),
-            })
+        # Figures change slowly compared to how often they are requested
+        key = f"article:stats:{request.user.id or 'anon'}"
+        stats = cache.get(key)
+        if stats is None:
+            stats = self._compute_stats(request.user)
+            cache.set(key, stats, STATS_CACHE_TIMEOUT)
         
         return Response(stats)
@@ -10,7 +10,13 @@ https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
 import os
 
 from django.core.asgi import get_asgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_asgi_application()
+
+# Build the URL resolver's lookup tables at boot rather than on the first
+# request. With a preloading server (e.g. gunicorn --preload) this happens
+# once in the master process and is shared by every worker.
+get_resolver().reverse_dict
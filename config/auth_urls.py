@@ -0,0 +1,31 @@
+"""
+JWT authentication routes, mounted under /api/auth/ by config/urls.py.
+
+Tokens are HS256-signed and verified locally (see SIMPLE_JWT); nothing
+calls out to an introspection service, and there is no verify endpoint:
+clients read the exp claim of their access token themselves and the API
+rejects invalid tokens.
+"""
+from django.urls import path, include
+from rest_framework_simplejwt.views import (
+    TokenObtainPairView,
+    TokenRefreshView,
+)
+
+# View callables are built once and referenced by name, so the same
+# objects can be shared by other route tables
+token_obtain_view = TokenObtainPairView.as_view()
+token_refresh_view = TokenRefreshView.as_view()
+
+# The sibling routes share one token/ prefix match. Declared as data so
+# config.urls.STATIC_ROUTE_TABLE is built from the same entries.
+token_routes = (
+    ('', token_obtain_view, 'token_obtain_pair'),
+    ('refresh/', token_refresh_view, 'token_refresh'),
+)
+
+urlpatterns = [
+    path('token/', include([
+        path(route, view, name=name) for route, view, name in token_routes
+    ])),
+]
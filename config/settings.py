@@ -34,6 +34,9 @@ ALLOWED_HOSTS = [
     '*',  # Allow all hosts in development (remove in production)
 ]
 
+# Mount the Django admin at /admin/ (turn off on hosts that only serve the API)
+ENABLE_ADMIN = config('ENABLE_ADMIN', default=True, cast=bool)
+
 
 # Application definition
 
@@ -59,6 +62,8 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    # Serves the JWT endpoints without URL resolution (config/urls.py)
+    'config.middleware.FastRouteMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -172,12 +177,41 @@ REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
 
+# =================================================================
+# CACHE CONFIGURATION
+# =================================================================
+
+# Local memory by default; point CACHE_BACKEND/CACHE_LOCATION at Redis or
+# Memcached in production so cached data is shared between workers, e.g.
+# CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+# CACHE_LOCATION=redis://127.0.0.1:6379/1
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='django-vue-llm-mini'),
+    }
+}
+
+# Count article views in the cache and write them back periodically with
+# `python manage.py flush_view_counts` instead of one UPDATE per view.
+# Requires a cache shared by all workers (Redis/Memcached).
+ARTICLE_VIEW_COUNT_BUFFER = config('ARTICLE_VIEW_COUNT_BUFFER', default=False, cast=bool)
+
+# How long article list pages are cached (seconds, 0 disables); any write
+# to an article invalidates them immediately
+ARTICLE_LIST_CACHE_SECONDS = config('ARTICLE_LIST_CACHE_SECONDS', default=30, cast=int)
+
 # =================================================================
 # JWT CONFIGURATION
 # =================================================================
 
+# Access tokens are checked locally against the HS256 signature on every
+# request; there is deliberately no online introspection or revocation
+# lookup, so keep their lifetime short.
 SIMPLE_JWT = {
-    'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
+    'ACCESS_TOKEN_LIFETIME': timedelta(
+        minutes=config('JWT_ACCESS_TOKEN_MINUTES', default=60, cast=int)
+    ),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
@@ -246,6 +280,20 @@ SPECTACULAR_SETTINGS = {
     ],
 }
 
+# Serve the schema, Swagger UI and ReDoc (by default only when DEBUG is on)
+ENABLE_API_DOCS = config('ENABLE_API_DOCS', default=DEBUG, cast=bool)
+
+# Serve /api/schema/ from this pre-generated file instead of introspecting
+# the API on every request (relative paths are resolved against BASE_DIR).
+# Build it with:
+#   ENABLE_API_DOCS=True python manage.py spectacular --format openapi-json --file schema.json
+# (the articles views only carry their schema annotations with docs enabled)
+API_SCHEMA_FILE = config(
+    'API_SCHEMA_FILE',
+    default='',
+    cast=lambda path: BASE_DIR / path if path else '',
+)
+
 # =================================================================
 # CUSTOM PAGINATION CLASS (Optional enhancement)
 # =================================================================
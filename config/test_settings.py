@@ -0,0 +1,25 @@
+"""
+Django settings for running the test suite.
+
+Extends the project settings with overrides that only make sense in tests.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+# The default PBKDF2 hasher is deliberately slow; every create_user() in the
+# tests would pay for it. MD5 is insecure but fine for throwaway test users.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Run the tests against an in-memory SQLite database so they never touch
+# the disk, whatever database the project itself is configured for.
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# The tests exercise the documentation routes regardless of DEBUG
+ENABLE_API_DOCS = True
@@ -0,0 +1,142 @@
+import os
+import tempfile
+from unittest import mock
+from django.contrib.auth.models import User
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+import json
+
+from . import urls as project_urls
+from .auth_urls import token_routes
+from .middleware import FastRouteMiddleware
+from .views import static_schema_view
+
+
+class TokenAuthTest(APITestCase):
+    """Test the JWT authentication endpoints."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+
+    def test_obtain_token_pair(self):
+        """Test logging in through the token endpoint returns a token pair."""
+        response = self.client.post(
+            reverse('token_obtain_pair'),
+            {'username': 'testuser', 'password': 'testpass123'},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('access', response.data)
+        self.assertIn('refresh', response.data)
+
+    def test_refresh_token_through_fast_route(self):
+        """Test the refresh endpoint answers with a rendered response."""
+        refresh = RefreshToken.for_user(self.user)
+        response = self.client.post(
+            project_urls.TOKEN_REFRESH_URL,
+            {'refresh': str(refresh)},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('access', json.loads(response.content))
+
+
+class FastRouteMiddlewareTest(SimpleTestCase):
+    """Test dispatching fixed token paths around the URL resolver."""
+
+    def setUp(self):
+        self.get_response = mock.Mock()
+        self.middleware = FastRouteMiddleware(self.get_response)
+        self.factory = RequestFactory()
+
+    def test_unknown_path_falls_through(self):
+        """Test paths outside the table go down the normal stack."""
+        request = self.factory.get('/api/articles/')
+
+        response = self.middleware(request)
+
+        self.get_response.assert_called_once_with(request)
+        self.assertIs(response, self.get_response.return_value)
+
+    def test_table_path_skips_stack(self):
+        """Test a table hit is answered by the view and rendered."""
+        request = self.factory.post(
+            project_urls.TOKEN_REFRESH_URL, {}, content_type='application/json'
+        )
+
+        response = self.middleware(request)
+
+        self.get_response.assert_not_called()
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('refresh', json.loads(response.content))
+
+    def test_table_matches_token_routes(self):
+        """Test the table covers exactly the named token routes."""
+        self.assertEqual(
+            set(project_urls.STATIC_ROUTE_TABLE),
+            {reverse(name) for _, _, name in token_routes},
+        )
+
+
+class URLConstantsTest(SimpleTestCase):
+    """Test the hard-coded and cached route paths match the URLconf."""
+
+    def test_constants_match_reverse(self):
+        """Test each constant equals the reversed route."""
+        expected = {
+            'token_obtain_pair': project_urls.TOKEN_OBTAIN_URL,
+            'token_refresh': project_urls.TOKEN_REFRESH_URL,
+            'schema': project_urls.SCHEMA_URL,
+        }
+        for name, url in expected.items():
+            with self.subTest(name=name):
+                self.assertEqual(reverse(name), url)
+                self.assertEqual(project_urls.cached_reverse(name), url)
+
+
+class DocsCacheControlTest(SimpleTestCase):
+    """Test the cache headers on the documentation pages."""
+
+    def test_swagger_ui_is_private(self):
+        """Test the page carrying a CSRF token is kept out of shared caches."""
+        response = self.client.get(reverse('swagger-ui'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('private', response['Cache-Control'])
+        self.assertNotIn('public', response['Cache-Control'])
+
+    def test_redoc_is_public(self):
+        """Test the token-free ReDoc page may be stored by proxies."""
+        response = self.client.get(reverse('redoc'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('public', response['Cache-Control'])
+        self.assertIn('max-age=3600', response['Cache-Control'])
+
+
+class StaticSchemaViewTest(SimpleTestCase):
+    """Test serving a pre-generated OpenAPI schema file."""
+
+    def test_serves_schema_file(self):
+        """Test the file content is returned with an OpenAPI content type."""
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as schema:
+            schema.write(b'{"openapi": "3.0.3"}')
+        self.addCleanup(os.remove, schema.name)
+
+        request = RequestFactory().get('/api/schema/')
+        with override_settings(API_SCHEMA_FILE=schema.name):
+            response = static_schema_view(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/vnd.oai.openapi+json')
+        self.assertEqual(b''.join(response.streaming_content), b'{"openapi": "3.0.3"}')
+        response.close()
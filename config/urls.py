@@ -4,46 +4,120 @@ URL configuration for config project.
 The `urlpatterns` list routes URLs to views. For more information please see:
     https://docs.djangoproject.com/en/5.0/topics/http/urls/
 """
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 from django.contrib import admin
-from django.urls import path, include
-from rest_framework_simplejwt.views import (
-    TokenObtainPairView,
-    TokenRefreshView,
-    TokenVerifyView,
-)
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
+from django.urls import path, include, reverse
+from django.views.decorators.cache import cache_control
 
-urlpatterns = [
-    # Django Admin
-    path('admin/', admin.site.urls),
-    
-    # API Documentation (OpenAPI/Swagger)
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
-    path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
-    path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
-    
-    # API Authentication endpoints
-    path('api/auth/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
-    path('api/auth/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
-    path('api/auth/token/verify/', TokenVerifyView.as_view(), name='token_verify'),
-    
-    # DRF Browsable API (for development)
-    path('api-auth/', include('rest_framework.urls')),
-    
+from .auth_urls import token_routes
+
+# Static leaves use path(), not re_path(). A converter-less RoutePattern
+# matches with one precompiled regex just like RegexPattern does, and newer
+# Django versions match it with plain string comparison instead.
+
+# Everything served under /api/. Grouping the routes behind one prefix lets
+# the resolver skip the whole group with a single check for other paths.
+#
+# Patterns are tried top to bottom, so they are ordered by how often they
+# are requested: the articles API first, then authentication, then the
+# rarely used documentation.
+api_patterns = [
     # Articles API
     path('', include('articles.urls')),
+    
+    # API Authentication endpoints
+    path('auth/', include('config.auth_urls')),
+]
+
+# API Documentation (OpenAPI/Swagger). Off in production unless enabled,
+# which keeps these routes (and their imports) out of the URLconf.
+if settings.ENABLE_API_DOCS:
+    from drf_spectacular.views import (
+        SpectacularAPIView,
+        SpectacularRedocView,
+        SpectacularSwaggerView,
+    )
+
+    # A schema generated at build time is served as a file; otherwise it is
+    # rebuilt from the code on every request
+    if settings.API_SCHEMA_FILE:
+        # Fail at startup rather than with a 500 on the first request
+        if not Path(settings.API_SCHEMA_FILE).is_file():
+            raise ImproperlyConfigured(
+                f"API_SCHEMA_FILE {settings.API_SCHEMA_FILE} does not exist; "
+                "generate it with 'manage.py spectacular --file'."
+            )
+        from .views import static_schema_view as schema_view
+    else:
+        schema_view = SpectacularAPIView.as_view()
+    swagger_view = SpectacularSwaggerView.as_view(url_name='schema')
+    redoc_view = SpectacularRedocView.as_view(url_name='schema')
+
+    # The docs only change on deploy; let browsers and proxies keep them
+    # for an hour instead of re-requesting them on every page load. The
+    # Swagger UI page embeds the caller's CSRF token and sets its cookie,
+    # so only the caller's own browser may keep that one.
+    cache_docs = cache_control(max_age=60 * 60, public=True)
+    cache_docs_private = cache_control(max_age=60 * 60, private=True)
+
+    docs_routes = (
+        ('schema/', cache_docs(schema_view), 'schema'),
+        ('docs/', cache_docs_private(swagger_view), 'swagger-ui'),
+        ('redoc/', cache_docs(redoc_view), 'redoc'),
+    )
+
+    api_patterns += [
+        path(route, view, name=name) for route, view, name in docs_routes
+    ]
+
+urlpatterns = [
+    path('api/', include(api_patterns)),
 ]
 
+# Django Admin
+if settings.ENABLE_ADMIN:
+    urlpatterns.append(path('admin/', admin.site.urls))
+
+# DRF Browsable API login/logout (development only)
+if settings.DEBUG:
+    urlpatterns.append(path('api-auth/', include('rest_framework.urls')))
+
+# Fixed paths of the parameterless routes, for code that would otherwise
+# reverse() them per request. The tests check they match reverse().
+TOKEN_OBTAIN_URL = '/api/auth/token/'
+TOKEN_REFRESH_URL = '/api/auth/token/refresh/'
+SCHEMA_URL = '/api/schema/'
+
+
+@lru_cache(maxsize=256)
+def cached_reverse(name):
+    """
+    reverse() for parameterless routes, memoized per route name.
+    Use it instead of reverse() on hot paths that link to the token or
+    docs routes ('token_obtain_pair', 'token_refresh', 'schema',
+    'swagger-ui', 'redoc'). The result is fixed once the URLconf
+    and script prefix are, so it must not be used for routes with
+    arguments.
+    """
+    return reverse(name)
+
+
+# Fixed paths served by FastRouteMiddleware without resolving. Only the
+# stateless JWT views belong here: they need no session, CSRF or auth
+# middleware. The path() entries above still provide reverse().
+STATIC_ROUTE_TABLE = {
+    TOKEN_OBTAIN_URL + route: view for route, view, _ in token_routes
+}
+
 # Available API endpoints:
 # ========================
 # Authentication:
 # POST /api/auth/token/          - Obtain JWT token pair (login)
 # POST /api/auth/token/refresh/  - Refresh access token
-# POST /api/auth/token/verify/   - Verify token validity
 # 
 # Articles:
 # GET    /api/articles/                    - List articles with pagination, search, filtering
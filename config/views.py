@@ -0,0 +1,22 @@
+"""
+Project-level views.
+"""
+from django.conf import settings
+from django.http import FileResponse
+from django.views.decorators.http import require_safe
+
+
+@require_safe
+def static_schema_view(request):
+    """
+    Serve the pre-generated OpenAPI schema from API_SCHEMA_FILE.
+    Generate it at build time with
+    ``ENABLE_API_DOCS=True python manage.py spectacular --file <path>``
+    (add ``--format openapi-json`` for JSON).
+    """
+    path = settings.API_SCHEMA_FILE
+    if str(path).endswith('.json'):
+        content_type = 'application/vnd.oai.openapi+json'
+    else:
+        content_type = 'application/vnd.oai.openapi'
+    return FileResponse(open(path, 'rb'), content_type=content_type)
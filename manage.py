@@ -6,6 +6,9 @@ import sys
 
 def main():
     """Run administrative tasks."""
+    # `manage.py test` gets the same test-only settings as pytest
+    if len(sys.argv) > 1 and sys.argv[1] == 'test':
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.test_settings')
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
     try:
         from django.core.management import execute_from_command_line